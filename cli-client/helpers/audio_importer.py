@@ -1,11 +1,19 @@
 import os
+import shutil
 import subprocess
 import wave
 
 def preprocess_audio_file_to_pcm(audio_file: str):
+    if shutil.which("sox") is None:
+        raise Exception("sox must be installed and available in the PATH to convert audio files.")
     tmp_audio_file = "./" + os.path.basename(audio_file) + "_tmp.wav"
-    command = "sox " + audio_file + " -e signed-integer " + tmp_audio_file
-    subprocess.run(command.split())
+    try:
+        subprocess.run(["sox", audio_file, "-e", "signed-integer", tmp_audio_file], check=True)
+    except Exception:
+        # Do not leave behind whatever sox managed to write before failing
+        if os.path.exists(tmp_audio_file):
+            remove_pcm_audio_file(tmp_audio_file)
+        raise
     return tmp_audio_file
 
 
@@ -18,11 +26,12 @@ class AudioImporter:
         tmp_audio_file = audio_file
         if convert_audio:
             tmp_audio_file = preprocess_audio_file_to_pcm(audio_file)
-        with open(tmp_audio_file, "rb") as wav_file:
-            with wave.open(wav_file) as wav_data:
+        try:
+            with wave.open(tmp_audio_file, "rb") as wav_data:
                 self.sample_rate = wav_data.getframerate()
                 self.n_samples = wav_data.getnframes()
                 self.sample_width = wav_data.getsampwidth()
                 self.audio = wav_data.readframes(self.n_samples)
-        if convert_audio:
-            remove_pcm_audio_file(tmp_audio_file)
+        finally:
+            if convert_audio:
+                remove_pcm_audio_file(tmp_audio_file)
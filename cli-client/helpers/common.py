@@ -1,7 +1,5 @@
-import math
 import argparse
 import logging
-from helpers.speechcenterauth import SpeechCenterCredentials
 
 
 class SynthesizerOptions:
@@ -29,12 +27,32 @@ def parse_credential_args(args, options):
     options.client_secret = args.client_secret or None
 
 
+def copy_parsed_args(args, options, option_args: dict):
+    for option, arg in option_args.items():
+        setattr(options, option, getattr(args, arg))
+
+
 def check_commandline_values(args):
     if not args.text and not args.text_file:
         logging.error("Synthesis text and text-file field cannot both be empty")
         raise ValueError("Synthesis text and text-file field cannot both be empty")
 
 
+# Maps each SynthesizerOptions attribute to the parsed argument it is read from
+TTS_OPTION_ARGS = {
+    'token_file': 'token',
+    'host': 'host',
+    'audio_file': 'audio_file',
+    'secure_channel': 'secure',
+    'audio_format': 'format',
+    'text': 'text',
+    'text_file': 'text_file',
+    'voice': 'voice',
+    'sample_rate': 'sample_rate',
+    'inactivity_timeout': 'inactivity_timeout'
+}
+
+
 def parse_tts_command_line() -> SynthesizerOptions:
     options = SynthesizerOptions()
     parser = argparse.ArgumentParser(description='Perform speech synthesis on a given text')
@@ -66,7 +84,8 @@ def parse_tts_command_line() -> SynthesizerOptions:
     parser.add_argument('--host', '-H', help='The URL of the host trying to reach', required=True)
     parser.add_argument('--not-secure', '-S', help='Do not use a secure channel. Used for internal testing.',
                         required=False, default=True, dest='secure', action='store_false')
-    parser.add_argument('--inactivity-timeout', '-i', help='Time for stream inactivity after the first valid response', required=False, default=5.0)
+    parser.add_argument('--inactivity-timeout', '-i', help='Time for stream inactivity after the first valid response', required=False, default=5.0,
+                        type=float)
 
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--text', '-T', help='Text to synthesize to audio')
@@ -83,21 +102,14 @@ def parse_tts_command_line() -> SynthesizerOptions:
     check_commandline_values(args)
     parse_credential_args(args, options)
 
-    options.token_file = args.token
-    options.host = args.host
-    options.audio_file = args.audio_file
-    options.secure_channel = args.secure
-    options.audio_format = args.format
-    options.text = args.text
-    options.text_file = args.text_file
-    options.voice = args.voice
-    options.sample_rate = args.sample_rate
-    options.inactivity_timeout = float(args.inactivity_timeout)
+    copy_parsed_args(args, options, TTS_OPTION_ARGS)
 
     return options
 
 
 def retrieve_token(options: SynthesizerOptions) -> str:
+    # Imported here so that clients and tests not dealing with authentication do not pay for jwt and requests
+    from helpers.speechcenterauth import SpeechCenterCredentials
     logging.info("Reading Speech Center JWT token from %s ...", options.token_file)
     if options.client_id:
         return SpeechCenterCredentials.get_refreshed_token(options.client_id, options.client_secret, options.token_file)
@@ -140,6 +152,23 @@ class RecognizerOptions:
             raise Exception("You must provide either a topic or a grammar only, not both")
 
 
+# Maps each RecognizerOptions attribute to the parsed argument it is read from
+CSR_OPTION_ARGS = {
+    'token_file': 'token',
+    'host': 'host',
+    'audio_file': 'audio_file',
+    'convert_audio': 'convert_audio',
+    'language': 'language',
+    'secure_channel': 'secure',
+    'formatting': 'formatting',
+    'diarization': 'diarization',
+    'hide_partial_results': 'hide_partial_results',
+    'inactivity_timeout': 'inactivity_timeout',
+    'asr_version': 'asr_version',
+    'label': 'label'
+}
+
+
 def parse_csr_commandline() -> RecognizerOptions:
     options = RecognizerOptions()
     parser = argparse.ArgumentParser(description='Perform speech recognition on an audio file')
@@ -182,7 +211,7 @@ def parse_csr_commandline() -> RecognizerOptions:
     parser.add_argument('--hide-partial-results', help='If set, do not show partial or incomplete transcriptions',
                         required=False, default=False, action='store_true')
     parser.add_argument('--inactivity-timeout', '-i', help='Time for stream inactivity after the first valid response',
-                        required=False, default=5.0)
+                        required=False, default=5.0, type=float)
     parser.add_argument('--asr-version', choices=['V1', 'V2'], help='Selectable asr version', required=True)
     parser.add_argument('--label', help='Label for the request', required=False, default="")
 
@@ -198,18 +227,7 @@ def parse_csr_commandline() -> RecognizerOptions:
     args = parser.parse_args()
     parse_credential_args(args, options)
 
-    options.token_file = args.token
-    options.host = args.host
-    options.audio_file = args.audio_file
-    options.convert_audio = args.convert_audio
-    options.language = args.language
-    options.secure_channel = args.secure
-    options.formatting = args.formatting
-    options.diarization = args.diarization
-    options.hide_partial_results = args.hide_partial_results
-    options.inactivity_timeout = float(args.inactivity_timeout)
-    options.asr_version = args.asr_version
-    options.label = args.label
+    copy_parsed_args(args, options, CSR_OPTION_ARGS)
 
     if args.inline_grammar:
         options.grammar = VerbioGrammar(VerbioGrammar.INLINE, args.inline_grammar)
@@ -225,13 +243,11 @@ def parse_csr_commandline() -> RecognizerOptions:
 
 def split_audio(audio: bytes, chunk_size: int = 20000):
     audio_length = len(audio)
-    chunk_count = math.ceil(audio_length / chunk_size)
-    logging.info("Dividing audio of length " + str(audio_length) + " into " + str(chunk_count) + " chunks of " + str(chunk_size) + " samples...")
+    chunk_count = (audio_length + chunk_size - 1) // chunk_size
+    logging.info("Dividing audio of length %i into %i chunks of %i samples...", audio_length, chunk_count, chunk_size)
     if chunk_count > 1:
-        for i in range(chunk_count):
-            start = i * chunk_size
-            end = min((i + 1) * chunk_size, audio_length)
-            yield audio[start:end]
+        for start in range(0, audio_length, chunk_size):
+            yield audio[start:start + chunk_size]
     else:
         yield audio
 
@@ -240,5 +256,5 @@ def split_text(text_file: str):
     with open(text_file) as f:
         for (i, line) in enumerate(f):
             text = line.rstrip()
-            logging.info("Text slice #" + str(i) + ": " + text)
+            logging.info("Text slice #%i: %s", i, text)
             yield text
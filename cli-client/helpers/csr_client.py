@@ -1,13 +1,15 @@
 import sys
 import pause
+import time
 import logging
-import datetime
+import itertools
 sys.path.insert(1, '../proto/generated')
 
 import threading
 from threading import Timer
 from concurrent.futures import ThreadPoolExecutor
 import recognition_streaming_request_pb2
+import recognition_streaming_response_pb2
 
 from helpers.common import split_audio
 from helpers.audio_importer import AudioImporter
@@ -16,6 +18,12 @@ from helpers.compiled_grammar_processing import get_compiled_grammar
 
 
 class CSRClient:
+    ASR_VERSIONS = {
+        "V1": recognition_streaming_request_pb2.RecognitionConfig.V1,
+        "V2": recognition_streaming_request_pb2.RecognitionConfig.V2
+    }
+    EMPTY_ALTERNATIVE = recognition_streaming_response_pb2.RecognitionAlternative()
+
     def __init__(self, executor: ThreadPoolExecutor, stub, options: RecognizerOptions, audio_resource: AudioImporter, token: str):
         self._executor = executor
         self._stub = stub
@@ -27,6 +35,7 @@ class CSRClient:
         self._peer_responded = threading.Event()
         self._token = token
         self._secure_channel = options.secure_channel
+        self._metadata = None if self._secure_channel else (('authorization', "Bearer " + self._token),)
         self._inactivity_timer = None
         self._inactivity_timer_timeout = options.inactivity_timeout
         self._asr_version = options.asr_version
@@ -45,15 +54,21 @@ class CSRClient:
         self._inactivity_timer.start()
 
     def _print_result(self, response):
-        if response.result.is_final:
-            transcript = "Final result:\n" \
-                f'\t"transcript": "{response.result.alternatives[0].transcript}",\n' \
-                f'\t"confidence": {response.result.alternatives[0].confidence},\n' \
-                f'\t"start_time": {response.result.start_time},\n' \
-                f'\t"duration": {response.result.duration}'
-            logging.info(transcript)
+        result = response.result
+        # Results where nothing was recognized come without alternatives
+        alternative = result.alternatives[0] if result.alternatives else self.EMPTY_ALTERNATIVE
+        if result.is_final:
+            logging.info('Final result:\n'
+                         '\t"transcript": "%s",\n'
+                         '\t"confidence": %s,\n'
+                         '\t"start_time": %s,\n'
+                         '\t"duration": %s',
+                         alternative.transcript,
+                         alternative.confidence,
+                         result.start_time,
+                         result.duration)
         elif not self._hide_partial_results:
-            logging.info(f'Partial transcript: "{response.result.alternatives[0].transcript}"')
+            logging.info('Partial transcript: "%s"', alternative.transcript)
 
     def _response_watcher(self, response_iterator):
         try:
@@ -64,7 +79,8 @@ class CSRClient:
                     self._inactivity_timer.cancel()
                 self._start_inactivity_timer(self._inactivity_timer_timeout)
 
-            self._inactivity_timer.cancel()
+            if self._inactivity_timer:
+                self._inactivity_timer.cancel()
             self._peer_responded.set()
 
         except Exception as e:
@@ -73,7 +89,6 @@ class CSRClient:
             raise
 
     def send_audio(self) -> None:
-        metadata = None if self._secure_channel else [('authorization', "Bearer " + self._token)]
         self.__generate_messages(
                 topic=self._topic,
                 grammar=self._grammar,
@@ -84,7 +99,7 @@ class CSRClient:
                 formatting=self._formatting,
                 diarization=self._diarization,
                 label=self._label)
-        response_iterator = self._stub.StreamingRecognize(self.__message_iterator(), metadata=metadata)
+        response_iterator = self._stub.StreamingRecognize(self.__message_iterator(), metadata=self._metadata)
         self._consumer_future = self._executor.submit(self._response_watcher, response_iterator)
 
     def wait_for_response(self) -> bool:
@@ -96,34 +111,31 @@ class CSRClient:
         return True
 
     def __message_iterator(self):
+        bytes_per_second = self._resources.sample_width * self._resources.sample_rate
         for message_type, message in self._messages:
-            logging.info("Sending streaming message " + message_type)
-            get_up_time = datetime.datetime.now()
+            logging.info("Sending streaming message %s", message_type)
+            get_up_time = time.time()
             if message_type == "audio":
-                sent_audio_samples = len(message.audio) // self._resources.sample_width
-                sent_audio_duration = sent_audio_samples / self._resources.sample_rate
-                get_up_time += datetime.timedelta(seconds=sent_audio_duration)
+                get_up_time += len(message.audio) / bytes_per_second
             yield message
             pause.until(get_up_time)
         logging.info("All audio messages sent")
 
-    def __generate_grammar_resource(self, grammar):
+    def __fill_grammar_resource(self, grammar_resource, grammar):
         if grammar.type == VerbioGrammar.INLINE:
-            return recognition_streaming_request_pb2.GrammarResource(inline_grammar=grammar.content)
+            grammar_resource.inline_grammar = grammar.content
         elif grammar.type == VerbioGrammar.URI:
-            return recognition_streaming_request_pb2.GrammarResource(grammar_uri=grammar.content)
+            grammar_resource.grammar_uri = grammar.content
         elif grammar.type == VerbioGrammar.COMPILED:
-                return recognition_streaming_request_pb2.GrammarResource(
-                    compiled_grammar=get_compiled_grammar(grammar.content))
-
-        raise Exception("Type of grammar not recognized.")
+            grammar_resource.compiled_grammar = get_compiled_grammar(grammar.content)
+        else:
+            raise Exception("Type of grammar not recognized.")
 
-    def __generate_recognition_resource(self, topic, grammar):
+    def __fill_recognition_resource(self, resource, topic, grammar):
         if grammar:
-            grammar_resource = self.__generate_grammar_resource(grammar)
-            return recognition_streaming_request_pb2.RecognitionResource(grammar=grammar_resource)
+            self.__fill_grammar_resource(resource.grammar, grammar)
         else:
-            return recognition_streaming_request_pb2.RecognitionResource(topic=topic)
+            resource.topic = recognition_streaming_request_pb2.RecognitionResource.Topic.Value(topic)
 
     def __generate_messages(self,
                             wav_audio: bytes,
@@ -136,30 +148,21 @@ class CSRClient:
                             formatting=False,
                             label: str = ""):
 
-        resource = self.__generate_recognition_resource(topic, grammar)
-        asr_versions = {"V1": 0, "V2": 1}
-        selected_asr_version = asr_versions[asr_version]
-
-        recognition_config = recognition_streaming_request_pb2.RecognitionConfig(
-                        parameters=recognition_streaming_request_pb2.RecognitionParameters(
-                            language=language,
-                            pcm=recognition_streaming_request_pb2.PCM(sample_rate_hz=sample_rate),
-                            enable_formatting=formatting,
-                            enable_diarization=diarization
-                        ),
-                        resource=resource,
-                        label=[label],
-                        version=selected_asr_version
-                    )
-
-        self._messages = [
-            ("config",
-                recognition_streaming_request_pb2.RecognitionStreamingRequest(
-                    config=recognition_config
-                )
-             ),
-        ]
-
+        # Fill the config in place so that no nested message gets built and then copied into its parent
+        config_request = recognition_streaming_request_pb2.RecognitionStreamingRequest()
+        recognition_config = config_request.config
+        recognition_config.parameters.language = language
+        recognition_config.parameters.pcm.sample_rate_hz = sample_rate
+        recognition_config.parameters.enable_formatting = formatting
+        recognition_config.parameters.enable_diarization = diarization
+        self.__fill_recognition_resource(recognition_config.resource, topic, grammar)
+        recognition_config.label.append(label)
+        recognition_config.version = self.ASR_VERSIONS[asr_version]
+
+        # Audio messages are only built as the stream consumes them
+        self._messages = itertools.chain([("config", config_request)], self.__generate_audio_messages(wav_audio))
+
+    def __generate_audio_messages(self, wav_audio: bytes):
         for chunk in split_audio(wav_audio):
-            logging.debug("Appending chunk as message: " + repr(chunk)[0:20] + "...")
-            self._messages.append(("audio", recognition_streaming_request_pb2.RecognitionStreamingRequest(audio=chunk)))
+            logging.debug("Appending chunk as message: %.20r...", chunk)
+            yield "audio", recognition_streaming_request_pb2.RecognitionStreamingRequest(audio=chunk)
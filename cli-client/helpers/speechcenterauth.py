@@ -2,7 +2,6 @@
 import jwt
 import requests
 from datetime import datetime
-import json
 import logging
 
 
@@ -22,8 +21,8 @@ class SpeechCenterCredentials:
             if datetime.now().timestamp() >= payload['exp']:
                 logging.info("Provided token is expired, proceeding to refresh")
                 refresh = True
-        except Exception:
-            logging.info("Provided file does not contain a valid JWT token, proceeding to retrieve a new token")
+        except Exception as e:
+            logging.info("Provided file does not contain a valid JWT token (%s), proceeding to retrieve a new token", e)
             refresh = True
         if refresh:
             newToken = SpeechCenterCredentials._refresh_token(client_id, client_secret)
@@ -36,21 +35,17 @@ class SpeechCenterCredentials:
     @staticmethod
     def _refresh_token(client_id, client_secret):
 
-        headers = {'Accept': 'application/json',
-                   'Content-Type': 'application/json'}
-        body = """{
-        "client_id":"%s",
-        "client_secret": "%s"
-        }""" % (client_id, client_secret)
+        headers = {'Accept': 'application/json'}
+        body = {"client_id": client_id, "client_secret": client_secret}
 
-        response = requests.post("https://auth.speechcenter.verbio.com:444/api/v1/token", headers=headers, data=body)
-        parsedResponse = json.loads(response.content)
+        response = requests.post("https://auth.speechcenter.verbio.com:444/api/v1/token", headers=headers, json=body)
+        parsedResponse = response.json()
 
         if response.status_code != 200:
             raise ConnectionRefusedError("Cannot refresh token. Error: " + parsedResponse['error'] + ": " + parsedResponse['message'])
         else:
-            logging.info("Succesfully updated service token:\n" + parsedResponse['access_token'])
-            logging.info("New expiration time is:\n" + str(parsedResponse['expiration_time']))
+            logging.info("Succesfully updated service token:\n%s", parsedResponse['access_token'])
+            logging.info("New expiration time is:\n%s", parsedResponse['expiration_time'])
 
         return parsedResponse['access_token']
 
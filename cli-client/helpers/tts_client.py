@@ -12,6 +12,11 @@ import verbio_speech_center_synthesizer_pb2
 
 
 class TTSClient:
+    SUPPORTED_SAMPLE_RATES = {
+        8000: verbio_speech_center_synthesizer_pb2.VoiceSamplingRate.VOICE_SAMPLING_RATE_8KHZ,
+        16000: verbio_speech_center_synthesizer_pb2.VoiceSamplingRate.VOICE_SAMPLING_RATE_16KHZ
+    }
+
     def __init__(self, executor: ThreadPoolExecutor, stub, options: SynthesizerOptions, token: str):
         self._executor = executor
         self._stub = stub
@@ -24,11 +29,10 @@ class TTSClient:
         self._peer_responded = threading.Event()
         self._token = token
         self._secure_channel = options.secure_channel
+        self._metadata = None if self._secure_channel else (('authorization', "Bearer " + self._token),)
         self._inactivity_timer = None
         self._inactivity_timer_timeout = options.inactivity_timeout
-        self._supported_sample_rates = {8000: verbio_speech_center_synthesizer_pb2.VoiceSamplingRate.VOICE_SAMPLING_RATE_8KHZ, 
-            16000: verbio_speech_center_synthesizer_pb2.VoiceSamplingRate.VOICE_SAMPLING_RATE_16KHZ}
- 
+
     def _compose_synthesis_request(self, text: str, voice: str, audio_format: str, sampling_rate: int):
         message = verbio_speech_center_synthesizer_pb2.SynthesisRequest(
             text=text,
@@ -48,14 +52,13 @@ class TTSClient:
         logging.info("Sending synthesis request for voice: -%s-, sampling_rate: %i and text: -%s-", self._voice, self._audio_sample_rate, self._text)
         selected_audio_format = AudioExporter.SUPPORTED_FORMATS[self._audio_format]
 
-        metadata = None if self._secure_channel else [('authorization', "Bearer " + self._token)]
         response, call = self._stub.SynthesizeSpeech.with_call(
             self._compose_synthesis_request(
                 text=self._text,
                 voice=self._voice,
-                sampling_rate=self._supported_sample_rates[self._audio_sample_rate],
+                sampling_rate=self.SUPPORTED_SAMPLE_RATES[self._audio_sample_rate],
                 audio_format=selected_audio_format
-            ), metadata=metadata
+            ), metadata=self._metadata
         )
 
         logging.info("Synthesis response [status=%s]", str(call.code()))
@@ -97,12 +100,11 @@ class TTSClient:
             raise
     
     def send_text(self) -> None:
-        metadata = None if self._secure_channel else [('authorization', "Bearer " + self._token)]
         self.__generate_messages(
                 text_file=self._text_file,
                 voice=self._voice,
                 sample_rate=self._audio_sample_rate),
-        response_iterator = self._stub.StreamingSynthesizeSpeech(self.__message_iterator(), metadata=metadata)
+        response_iterator = self._stub.StreamingSynthesizeSpeech(self.__message_iterator(), metadata=self._metadata)
         self._consumer_future = self._executor.submit(self._response_watcher, response_iterator)
 
     def wait_for_response(self) -> bool:
@@ -115,7 +117,7 @@ class TTSClient:
 
     def __message_iterator(self):
         for message_type, message in self._messages:
-            logging.info("Sending streaming message " + message_type)
+            logging.info("Sending streaming message %s", message_type)
             yield message
         logging.info("All audio messages sent")
 
@@ -127,7 +129,7 @@ class TTSClient:
     ):
         synthesis_config = verbio_speech_center_synthesizer_pb2.SynthesisConfig(
             voice=voice,
-            sampling_rate=self._supported_sample_rates[sample_rate],
+            sampling_rate=self.SUPPORTED_SAMPLE_RATES[sample_rate],
         )
 
         self._messages = [
@@ -28,9 +28,9 @@ def run(options: RecognizerOptions):
     grpc_connection = GrpcConnection(options.secure_channel, options.client_id, options.client_secret, access_token)
 
     with grpc_connection.open(options.host) as grpc_channel:
-        executor = ThreadPoolExecutor()
-        future = executor.submit(process_recognition, executor, grpc_channel, options, access_token)
-        future.result()
+        # The request is driven from this thread, the only worker watches the responses
+        executor = ThreadPoolExecutor(max_workers=1)
+        process_recognition(executor, grpc_channel, options, access_token)
 
 
 if __name__ == '__main__':
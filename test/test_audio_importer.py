@@ -0,0 +1,27 @@
+import pytest
+import subprocess
+from unittest.mock import patch
+from helpers.audio_importer import preprocess_audio_file_to_pcm
+
+
+@patch("helpers.audio_importer.shutil")
+@patch("helpers.audio_importer.subprocess")
+def test_preprocess_audio_removes_partial_file_on_sox_failure(mock_subprocess, mock_shutil, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mock_shutil.which.return_value = "/usr/bin/sox"
+
+    def failing_sox(command, check):
+        (tmp_path / "audio.wav_tmp.wav").write_bytes(b'partial audio')
+        raise subprocess.CalledProcessError(2, command)
+
+    mock_subprocess.run.side_effect = failing_sox
+    with pytest.raises(subprocess.CalledProcessError):
+        preprocess_audio_file_to_pcm("audio.wav")
+    assert not (tmp_path / "audio.wav_tmp.wav").exists()
+
+
+@patch("helpers.audio_importer.shutil")
+def test_preprocess_audio_without_sox(mock_shutil):
+    mock_shutil.which.return_value = None
+    with pytest.raises(Exception, match="sox must be installed"):
+        preprocess_audio_file_to_pcm("audio.wav")
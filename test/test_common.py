@@ -0,0 +1,16 @@
+from helpers.common import split_audio
+
+
+def test_split_audio_exact_chunks():
+    chunks = list(split_audio(b'0123456789ab', chunk_size=4))
+    assert chunks == [b'0123', b'4567', b'89ab']
+
+
+def test_split_audio_last_chunk_is_shorter():
+    chunks = list(split_audio(b'0123456789', chunk_size=4))
+    assert chunks == [b'0123', b'4567', b'89']
+
+
+def test_split_audio_single_chunk():
+    audio = b'0123'
+    assert list(split_audio(audio, chunk_size=20000)) == [audio]
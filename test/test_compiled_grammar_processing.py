@@ -0,0 +1,20 @@
+import pytest
+from helpers.compiled_grammar_processing import get_compiled_grammar
+
+
+def test_get_compiled_grammar(tmp_path):
+    grammar_file = tmp_path / "grammar.tar.xz"
+    grammar_file.write_bytes(b'compiled grammar')
+    assert get_compiled_grammar(str(grammar_file)) == b'compiled grammar'
+
+
+def test_get_compiled_grammar_missing_file(tmp_path):
+    with pytest.raises(ValueError, match="file does not exist") as error:
+        get_compiled_grammar(str(tmp_path / "missing.tar.xz"))
+    assert error.value.__cause__ is None
+    assert error.value.__suppress_context__
+
+
+def test_get_compiled_grammar_wrong_format():
+    with pytest.raises(ValueError, match="is not .tar.xz"):
+        get_compiled_grammar("grammar.zip")
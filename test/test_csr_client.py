@@ -1,71 +1,100 @@
 import sys
 sys.path.insert(1, '../proto/generated')
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, mock_open, patch
 from helpers.csr_client import CSRClient
 from helpers.common import VerbioGrammar, RecognizerOptions
 from concurrent.futures import ThreadPoolExecutor
 import recognition_streaming_response_pb2 as response
 
+AUDIO = b'0000000000000000'
+FINAL_RESPONSE = response.RecognitionStreamingResponse(result=response.RecognitionResult(is_final=True))
 
-def test_recognition_full_flow():
-    mock_stub = Mock()
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor() as executor:
+        yield executor
+
+
+def build_options(**overrides) -> RecognizerOptions:
     options = RecognizerOptions()
     options.inactivity_timeout = 0.1
     options.asr_version = "V2"
     options.topic = "GENERIC"
     options.language = "en-US"
     options.label = "label"
-    options.formatting = False
-    options.diarization = False
+    for name, value in overrides.items():
+        setattr(options, name, value)
+    return options
+
 
+def build_audio_resource(sample_rate: int = 16000):
     audio_resource = Mock()
-    audio_resource.sample_rate = 16000
-    audio_resource.audio = b'0000000000000000'
+    audio_resource.sample_rate = sample_rate
+    audio_resource.sample_width = 2
+    audio_resource.audio = AUDIO
+    return audio_resource
 
-    executor = ThreadPoolExecutor()
-    recognition_result = response.RecognitionResult(is_final=True)
-    mock_response = response.RecognitionStreamingResponse(result=recognition_result)
-    mock_stub.StreamingRecognize.return_value = [mock_response, mock_response]
+
+def run_recognition(executor: ThreadPoolExecutor, options: RecognizerOptions, audio_resource, responses) -> bool:
+    mock_stub = Mock()
+    mock_stub.StreamingRecognize.return_value = responses
     client = CSRClient(executor, mock_stub, options, audio_resource, "token")
     client.send_audio()
-    client.wait_for_response()
+    return client.wait_for_response()
+
+
+@pytest.mark.parametrize("topic, grammar", [
+    ("GENERIC", None),
+    (None, VerbioGrammar(VerbioGrammar.URI, "test/grammar")),
+    (None, VerbioGrammar(VerbioGrammar.INLINE, "test inline grammar"))
+])
+def test_recognition_full_flow(executor, topic, grammar):
+    options = build_options(topic=topic, grammar=grammar)
+    assert run_recognition(executor, options, build_audio_resource(), [FINAL_RESPONSE, FINAL_RESPONSE])
 
 
-def test_recognition_full_flow_exception():
+@patch("helpers.csr_client.pause")
+@patch("helpers.csr_client.time")
+def test_recognition_streams_config_then_paced_audio_chunks(mock_time, mock_pause, executor):
+    mock_time.time.return_value = 100.0
+    sent_requests = []
+
+    def streaming_recognize(requests, metadata):
+        sent_requests.extend(requests)
+        return [FINAL_RESPONSE]
+
     mock_stub = Mock()
-    options = RecognizerOptions()
-    options.inactivity_timeout = 0.1
-    options.asr_version = "V1"
-    executor = ThreadPoolExecutor()
-    audio_resource = Mock()
-    audio_resource.sample_rate = 8000
-    mock_stub.StreamingRecognize.side_effect = Exception("Exception while sending audio")
-    client = CSRClient(executor, mock_stub, options, audio_resource, "token")
-    with pytest.raises(Exception):
-        client.send_audio()
-        client.wait_for_response()
+    mock_stub.StreamingRecognize.side_effect = streaming_recognize
+    audio_resource = build_audio_resource(16000)
+    audio_resource.audio = b'\x01\x02' * 22500
+    client = CSRClient(executor, mock_stub, build_options(), audio_resource, "token")
+    client.send_audio()
+    assert client.wait_for_response()
+
+    assert [request.WhichOneof("recognition_request") for request in sent_requests] == ["config", "audio", "audio", "audio"]
+    assert [len(request.audio) for request in sent_requests[1:]] == [20000, 20000, 5000]
+    assert b''.join(request.audio for request in sent_requests[1:]) == audio_resource.audio
+    # Each audio message waits for as long as it takes to play it: bytes / (sample_width * sample_rate)
+    assert [call.args[0] for call in mock_pause.until.call_args_list] == [100.0, 100.625, 100.625, 100.15625]
+
 
+def test_recognition_full_flow_compiled_grammar(executor):
+    options = build_options(topic=None, grammar=VerbioGrammar(VerbioGrammar.COMPILED, "grammar.tar.xz"))
+    with patch("helpers.compiled_grammar_processing.open", mock_open(read_data=b"compiled grammar"), create=True) as mocked_open:
+        assert run_recognition(executor, options, build_audio_resource(), [FINAL_RESPONSE, FINAL_RESPONSE])
+    mocked_open.assert_called_once_with("grammar.tar.xz", mode="rb")
 
-def test_recognition_full_flow_grammar():
+
+def test_recognition_full_flow_exception(executor):
     mock_stub = Mock()
-    options = RecognizerOptions()
-    options.inactivity_timeout = 0.1
-    options.asr_version = "V2"
-    options.grammar = VerbioGrammar(VerbioGrammar.URI, "test/grammar")
-    options.language = "en-US"
-    options.label = "label"
-    options.formatting = False
-    options.diarization = False
+    mock_stub.StreamingRecognize.side_effect = Exception("Exception while sending audio")
+    client = CSRClient(executor, mock_stub, build_options(asr_version="V1"), build_audio_resource(8000), "token")
+    with pytest.raises(Exception, match="Exception while sending audio"):
+        client.send_audio()
+        client.wait_for_response()
 
-    audio_resource = Mock()
-    audio_resource.sample_rate = 16000
-    audio_resource.audio = b'0000000000000000'
 
-    executor = ThreadPoolExecutor()
-    recognition_result = response.RecognitionResult(is_final=True)
-    mock_response = response.RecognitionStreamingResponse(result=recognition_result)
-    mock_stub.StreamingRecognize.return_value = [mock_response, mock_response]
-    client = CSRClient(executor, mock_stub, options, audio_resource, "token")
-    client.send_audio()
-    client.wait_for_response()
+def test_recognition_full_flow_no_responses(executor):
+    assert run_recognition(executor, build_options(asr_version="V1"), build_audio_resource(), [])
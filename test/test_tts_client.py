@@ -1,47 +1,24 @@
+import pytest
 from tts_mocks import TTSStubMockResponse, TTSStubMockCall
 from helpers.tts_client import TTSClient
 from helpers.common import SynthesizerOptions
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock
 
-@patch('helpers.audio_exporter.AudioExporter.save_audio')
-def test_synthesis_full_flow_wav(mock_save_audio):
-    mock_save_audio.return_value = "mock audio"
-    mock_stub = Mock()
-    mock_executor = MagicMock()
-    mock_stub.SynthesizeSpeech.with_call.return_value = (TTSStubMockResponse(), TTSStubMockCall())
-    options = SynthesizerOptions()
-    options.audio_format = "wav"
-    options.text = "Hello"
-    options.sample_rate = 8000
-    client = TTSClient(mock_executor, mock_stub, options, "token")
-    audio_samples = client.synthesize()
-    assert len(audio_samples) == 24
 
-
-@patch('helpers.audio_exporter.AudioExporter.save_audio')
-def test_synthesis_full_flow_raw(mock_save_audio):
-    mock_save_audio.return_value = "mock audio"
+@pytest.mark.parametrize("audio_format, sample_rate, secure_channel", [
+    ("wav", 8000, True),
+    ("raw", 16000, True),
+    ("wav", 8000, False)
+])
+def test_synthesis_full_flow(audio_format, sample_rate, secure_channel):
     mock_stub = Mock()
-    mock_executor = MagicMock()
+    mock_executor = Mock()
     mock_stub.SynthesizeSpeech.with_call.return_value = (TTSStubMockResponse(), TTSStubMockCall())
     options = SynthesizerOptions()
-    options.audio_format = "raw"
-    options.sample_rate = 16000
-    client = TTSClient(mock_executor, mock_stub, options, "token")
-    audio_samples = client.synthesize()
-    assert len(audio_samples) == 24
-
-
-@patch('helpers.audio_exporter.AudioExporter.save_audio')
-def test_synthesis_full_flow_wav_unsecured(mock_save_audio):
-    mock_save_audio.return_value = "mock audio"
-    mock_stub = Mock()
-    mock_executor = MagicMock()
-    mock_stub.SynthesizeSpeech.with_call.return_value = (TTSStubMockResponse(), TTSStubMockCall())
-    options = SynthesizerOptions()
-    options.audio_format = "wav"
-    options.sample_rate = 8000
-    options.secure_channel = False
+    options.audio_format = audio_format
+    options.text = "Hello"
+    options.sample_rate = sample_rate
+    options.secure_channel = secure_channel
     client = TTSClient(mock_executor, mock_stub, options, "token")
     audio_samples = client.synthesize()
     assert len(audio_samples) == 24
@@ -6,5 +6,4 @@ class TTSStubMockCall:
 
 
 class TTSStubMockResponse:
-    def __init__(self):
-        self.audio_samples = b'your audio samples here!'
+    audio_samples = b'your audio samples here!'